@@ -5,40 +5,273 @@ Console entrypoint for the `gemini_code_review` command line tool.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import importlib.util
+import io
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-
-try:
-    from .prompting import run_code_review  # type: ignore
-except Exception:  # pragma: no cover - we handle absence later
-    run_code_review = None  # type: ignore
+from xml.sax.saxutils import quoteattr
 
 
 def ensure_repomix_available() -> bool:
-    """Return True if we can invoke repomix directly, else False."""
-    try:
-        subprocess.run(
-            ["repomix", "--version"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=True,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    """Return True if a repomix executable is on PATH, else False.
+
+    Only looks the executable up on PATH rather than spawning `repomix
+    --version`; a broken install still surfaces as a RuntimeError from
+    dump_repo_to_xml.
+    """
+    return shutil.which("repomix") is not None
+
+
+# Paths always skipped by the in-process walker (gitignore syntax). Mirrors the
+# `--ignore` list passed to repomix plus the VCS / dependency / lock files that
+# repomix skips by default. The walker has no secret scanning, so env files are
+# always excluded, gitignored or not.
+DEFAULT_IGNORE_PATTERNS = [
+    ".env*",
+    ".git/",
+    ".next/",
+    ".open-next/",
+    "node_modules/",
+    "__pycache__/",
+    ".venv/",
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "poetry.lock",
+    "uv.lock",
+    "Cargo.lock",
+]
+
+DUMP_BACKENDS = ("auto", "python", "repomix")
+
+
+def pathspec_available() -> bool:
+    """Return True if the optional pathspec package can be imported."""
+    return importlib.util.find_spec("pathspec") is not None
+
+
+def resolve_dump_backend(backend: str) -> str:
+    """Resolve "auto" to repomix when it's on PATH.
+
+    The in-process walker is only a fallback (when pathspec is installed), as
+    it lacks repomix's secret check and config / .repomixignore support.
+    """
+    if backend == "auto":
+        if ensure_repomix_available() or not pathspec_available():
+            return "repomix"
+        return "python"
+    return backend
+
+
+def _load_gitignore(directory: Path):
+    """Return a PathSpec for directory/.gitignore, or None if there isn't one."""
+    import pathspec
+
+    gitignore = directory / ".gitignore"
+    if not gitignore.is_file():
+        return None
+    lines = gitignore.read_text(encoding="utf-8", errors="replace").splitlines()
+    return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+
+
+def _walk_repo_to_xml(repo_path: Path) -> str:
+    """Dump the repo to repomix-style XML in-process, honouring every .gitignore."""
+    import pathspec
+
+    default_spec = pathspec.PathSpec.from_lines("gitwildmatch", DEFAULT_IGNORE_PATTERNS)
+    # (base directory, spec) pairs in effect for each directory still to visit;
+    # a .gitignore's patterns are matched relative to its own directory
+    specs_by_dir = {Path("."): [(Path("."), default_spec)]}
+
+    def is_ignored(specs, rel_path: Path, is_dir: bool) -> bool:
+        for base, spec in specs:
+            candidate = rel_path.relative_to(base).as_posix()
+            if spec.match_file(f"{candidate}/" if is_dir else candidate):
+                return True
         return False
 
+    out = io.StringIO()
+    out.write("<files>\n")
+    for dirpath, dirnames, filenames in os.walk(repo_path):
+        rel_dir = Path(dirpath).relative_to(repo_path)
+        specs = specs_by_dir.pop(rel_dir)
+        gitignore_spec = _load_gitignore(Path(dirpath))
+        if gitignore_spec is not None:
+            specs = [*specs, (rel_dir, gitignore_spec)]
+
+        # Prune ignored directories in place so os.walk never descends into them
+        dirnames[:] = sorted(d for d in dirnames if not is_ignored(specs, rel_dir / d, True))
+        for d in dirnames:
+            specs_by_dir[rel_dir / d] = specs
+
+        for filename in sorted(filenames):
+            if is_ignored(specs, rel_dir / filename, False):
+                continue
+            # Never follow symlinks (as repomix doesn't): they can point outside
+            # the repo. os.walk already leaves directory symlinks unvisited.
+            if os.path.islink(os.path.join(dirpath, filename)):
+                continue
+            rel_path = (rel_dir / filename).as_posix()
+            try:
+                raw = (Path(dirpath) / filename).read_bytes()
+            except OSError:
+                continue
+            # Skip binary files, as repomix does
+            if b"\0" in raw[:8192]:
+                continue
+            try:
+                text = raw.decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+            out.write(f"<file path={quoteattr(rel_path)}>\n")
+            out.write(text)
+            if not text.endswith("\n"):
+                out.write("\n")
+            out.write("</file>\n\n")
+    out.write("</files>\n")
+    return out.getvalue()
+
+
+# Target size (in characters) of each chunk handed to tiktoken
+TOKEN_CHUNK_CHARS = 64 * 1024
+
+# Number of chunks tokenized per encode_ordinary_batch call; bounds how many
+# token lists are alive at once
+TOKEN_BATCH_SIZE = 8
+
+
+def _iter_text_chunks(text: str, chunk_chars: int = TOKEN_CHUNK_CHARS):
+    """Yield ~chunk_chars slices of text, split just after a newline where possible."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = start + chunk_chars
+        if end < length:
+            newline = text.rfind("\n", start, end)
+            if newline != -1:
+                end = newline + 1
+        yield text[start:end]
+        start = end
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoder():
+    """Return the tiktoken encoder, loading its BPE ranks only once per process."""
+    import tiktoken  # type: ignore
+
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Fallback to a widely available base if o200k_base is not present
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _run_in_background(fn, name: str) -> concurrent.futures.Future:
+    """Start fn() in the background and return a future for its result.
+
+    Runs on a daemon thread rather than an executor: executor workers are
+    joined at interpreter exit, which would make early error returns and
+    Ctrl-C wait for (possibly network-bound) loads like BPE downloads.
+    """
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+def _load_encoder_in_background() -> concurrent.futures.Future:
+    """Start loading the tiktoken encoder and return a future for it."""
+    return _run_in_background(_get_encoder, "load-tiktoken-encoder")
+
+
+def _build_agent_in_background() -> concurrent.futures.Future:
+    """Start importing pydantic-ai and building the review agent."""
+
+    def build():
+        from .prompting import get_code_review_agent
+
+        return get_code_review_agent()
+
+    return _run_in_background(build, "build-review-agent")
+
+
+def count_tokens(enc, text: str) -> int:
+    """Count tokens in text without holding the full token list in memory."""
+    count = 0
+    batch: list[str] = []
+    for chunk in _iter_text_chunks(text):
+        batch.append(chunk)
+        if len(batch) == TOKEN_BATCH_SIZE:
+            count += sum(len(tokens) for tokens in enc.encode_ordinary_batch(batch))
+            batch = []
+    if batch:
+        count += sum(len(tokens) for tokens in enc.encode_ordinary_batch(batch))
+    return count
+
 
-def dump_repo_to_xml(repo_path: Path, keep: bool = False) -> str:
-    """Run repomix to dump repo to a temporary XML file and return its content."""
+def _run_repomix(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """Run a repomix command, translating failures into RuntimeError."""
+    try:
+        return subprocess.run(cmd, check=True, **kwargs)
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            "`repomix` not found. Please install repomix and ensure it is in your PATH."
+        ) from e
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"repomix failed (exit {e.returncode}).") from e
+
+
+def _keep_xml(data: bytes) -> Path:
+    """Persist an XML dump to a temp file for inspection and return its path.
+
+    The bytes go to a ".part" file that is renamed into place, so an
+    interrupted write never leaves a truncated XML behind.
+    """
+    with tempfile.NamedTemporaryFile(
+        prefix="repomix_", suffix=".xml.part", delete=False
+    ) as tmp:
+        part_path = Path(tmp.name)
+    kept_path = part_path.with_suffix("")
+    try:
+        part_path.write_bytes(data)
+        os.replace(part_path, kept_path)
+    finally:
+        part_path.unlink(missing_ok=True)
+    print(f"[info] Kept temp XML at: {kept_path}", file=sys.stderr)
+    return kept_path
+
+
+def dump_repo_to_xml(repo_path: Path, keep: bool = False, backend: str = "auto") -> str:
+    """Dump the repo to XML and return its content.
+
+    The "python" backend walks the repo in-process; the "repomix" backend pipes
+    repomix's output back over stdout. "auto" uses repomix if it's on PATH,
+    else the walker when pathspec is installed.
+    With keep=True the XML is also saved to a temp file that is left in place.
+    """
     if not repo_path.is_dir():
         raise ValueError(f"Provided path is not a directory: {repo_path}")
 
-    with tempfile.NamedTemporaryFile(prefix="repomix_", suffix=".xml", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
+    if resolve_dump_backend(backend) == "python":
+        content = _walk_repo_to_xml(repo_path)
+        if keep:
+            _keep_xml(content.encode("utf-8"))
+        return content
 
     cmd = [
         "repomix",
@@ -47,35 +280,247 @@ def dump_repo_to_xml(repo_path: Path, keep: bool = False) -> str:
         "xml",
         "--ignore",
         ".next/,.open-next/",
-        "--output",
-        str(tmp_path),
+        "--stdout",
         str(repo_path),
     ]
+    result = _run_repomix(cmd, stdout=subprocess.PIPE)
+    if keep:
+        _keep_xml(result.stdout)
+    return result.stdout.decode("utf-8")
 
-    try:
-        subprocess.run(cmd, check=True)
-    except FileNotFoundError as e:
-        if tmp_path.exists() and not keep:
-            tmp_path.unlink(missing_ok=True)
-        raise RuntimeError(
-            "`repomix` not found. Please install repomix and ensure it is in your PATH."
-        ) from e
-    except subprocess.CalledProcessError as e:
-        if tmp_path.exists() and not keep:
-            tmp_path.unlink(missing_ok=True)
-        raise RuntimeError(f"repomix failed (exit {e.returncode}).") from e
 
-    try:
-        content = tmp_path.read_text(encoding="utf-8")
-    finally:
-        if not keep:
-            try:
-                tmp_path.unlink(missing_ok=True)
-            except OSError:
-                pass
-        else:
-            print(f"[info] Kept temp XML at: {tmp_path}", file=sys.stderr)
-    return content
+# Column widths for the "Review" sheet, keyed by column name
+REVIEW_COLUMN_WIDTHS = {
+    "category": 15,
+    "title": 40,
+    "severity": 10,
+    "location": 25,
+    "estimated_effort": 15,
+    "rationale": 40,
+    "implementation_plan": 60,
+    "detailed_description": 60,
+    "copy_paste": 20,
+}
+
+# Background colours for the severity / estimated_effort cells
+FILL_COLORS = {
+    "Low": "#C6EFCE",
+    "Medium": "#FFEB9C",
+    "High": "#F8CBAD",
+    "Critical": "#FFC7CE",
+    "Very High": "#FFC7CE",
+}
+
+FILLED_COLUMNS = ("severity", "estimated_effort")
+
+# Header of the "ABOUT" sheet; its rows are (field, value) pairs
+ABOUT_COLUMNS = ("Field", "Value")
+
+
+def pyexcelerate_available() -> bool:
+    """Return True if the optional pyexcelerate package can be imported."""
+    return importlib.util.find_spec("pyexcelerate") is not None
+
+
+# Maximum number of characters Excel allows in a single cell
+XLSX_MAX_CELL_CHARS = 32767
+
+
+def _clip_cell(value, row_idx: int, col_idx: int):
+    """Truncate strings to Excel's cell limit, warning with the (0-based) cell."""
+    if isinstance(value, str) and len(value) > XLSX_MAX_CELL_CHARS:
+        from xlsxwriter.utility import xl_rowcol_to_cell
+
+        print(
+            f"[warn] Truncated {xl_rowcol_to_cell(row_idx, col_idx)} to Excel's "
+            f"{XLSX_MAX_CELL_CHARS:,}-character cell limit.",
+            file=sys.stderr,
+        )
+        return value[:XLSX_MAX_CELL_CHARS]
+    return value
+
+
+def _write_row_xlsxwriter(worksheet, row_idx: int, values, cell_format=None) -> None:
+    """Write a row cell by cell, so one rejected value can't drop the rest of it.
+
+    Over-long strings are truncated to Excel's cell limit; any other write
+    error is reported on stderr and the row carries on.
+    """
+    from xlsxwriter.utility import xl_rowcol_to_cell
+
+    for col_idx, value in enumerate(values):
+        status = worksheet.write(
+            row_idx, col_idx, _clip_cell(value, row_idx, col_idx), cell_format
+        )
+        if status != 0:
+            cell = xl_rowcol_to_cell(row_idx, col_idx)
+            print(f"[warn] Failed to write {cell} (xlsxwriter code {status}).", file=sys.stderr)
+
+
+def write_excel_xlsxwriter(out_path: Path, df, about_rows: list[tuple]) -> None:
+    """Write the Review and ABOUT sheets using xlsxwriter."""
+    import xlsxwriter
+    from xlsxwriter.utility import xl_range
+
+    columns = df.columns.tolist()
+
+    # constant_memory streams each row to disk as soon as the next one starts,
+    # so rows must be written in order. pandas' to_excel writes column-major
+    # and would silently drop cells in this mode, so it is bypassed entirely.
+    # Model output is written verbatim: no auto-hyperlinks or formulas.
+    options = {
+        "constant_memory": True,
+        "strings_to_urls": False,
+        "strings_to_formulas": False,
+    }
+    with xlsxwriter.Workbook(str(out_path), options) as workbook:
+        wrap_format = workbook.add_format({"text_wrap": True, "valign": "top"})
+        nowrap_format = workbook.add_format({"text_wrap": False, "valign": "top"})
+        # Same look as the header pandas' to_excel used to write
+        header_format = workbook.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        )
+        # One format per distinct colour, shared by every value that uses it
+        formats_by_color = {
+            color: workbook.add_format({"bg_color": color, "text_wrap": True, "valign": "top"})
+            for color in set(FILL_COLORS.values())
+        }
+        fill_formats = {
+            value: formats_by_color[color] for value, color in FILL_COLORS.items()
+        }
+
+        worksheet = workbook.add_worksheet("Review")
+
+        # Column formats apply to every cell written without its own format,
+        # so wrapping / top alignment needs no per-cell pass. The copy_paste
+        # column is kept unwrapped.
+        for col_index, column_name in enumerate(columns):
+            col_format = nowrap_format if column_name == "copy_paste" else wrap_format
+            worksheet.set_column(
+                col_index, col_index, REVIEW_COLUMN_WIDTHS.get(column_name), col_format
+            )
+
+        # Freeze header row and the first two columns (category, title)
+        worksheet.freeze_panes(1, 2)
+
+        _write_row_xlsxwriter(worksheet, 0, columns, header_format)
+        for row_idx, values in enumerate(df.values.tolist(), start=1):
+            _write_row_xlsxwriter(worksheet, row_idx, values)
+
+        # Severity / effort colouring via conditional formats: one rule per value,
+        # each spanning both coloured columns, rather than touching every cell.
+        last_row = len(df)
+        if last_row:
+            filled_ranges = []
+            for column_name in FILLED_COLUMNS:
+                col_index = columns.index(column_name)
+                filled_ranges.append(xl_range(1, col_index, last_row, col_index))
+            for value, fill_format in fill_formats.items():
+                worksheet.conditional_format(
+                    filled_ranges[0],
+                    {
+                        "type": "cell",
+                        "criteria": "==",
+                        "value": f'"{value}"',
+                        "format": fill_format,
+                        "multi_range": " ".join(filled_ranges),
+                    },
+                )
+
+        about_ws = workbook.add_worksheet("ABOUT")
+        # Reasonable column widths; wrapping and top alignment come from the
+        # same shared column format as the Review sheet.
+        about_ws.set_column(0, 0, 24, wrap_format)
+        about_ws.set_column(1, 1, 90, wrap_format)
+        _write_row_xlsxwriter(about_ws, 0, ABOUT_COLUMNS, header_format)
+        for row_idx, values in enumerate(about_rows, start=1):
+            _write_row_xlsxwriter(about_ws, row_idx, values)
+
+
+def write_excel_pyexcelerate(out_path: Path, df, about_rows: list[tuple]) -> None:
+    """Write the Review and ABOUT sheets using pyexcelerate.
+
+    pyexcelerate emits the sheet XML directly from a list of rows, skipping a
+    per-cell object model. It has no conditional formatting, so fills are set
+    on the two coloured columns only.
+    """
+    from pyexcelerate import Alignment, Color, Fill, Font, Panes, Style, Workbook
+    from pyexcelerate.Border import Border
+    from pyexcelerate.Borders import Borders
+    from pyexcelerate.DataTypes import DataTypes
+
+    columns = df.columns.tolist()
+    wrap_alignment = Alignment(vertical="top", wrap_text=True)
+    nowrap_alignment = Alignment(vertical="top", wrap_text=False)
+    # pyexcelerate turns any string starting with "=" into a formula unless the
+    # cell's style pins the type; model output must stay plain text
+    as_text = DataTypes.INLINE_STRING
+
+    def clip_rows(rows):
+        return [
+            [_clip_cell(value, row_idx, col_idx) for col_idx, value in enumerate(row)]
+            for row_idx, row in enumerate(rows)
+        ]
+
+    workbook = Workbook()
+    worksheet = workbook.new_sheet(
+        "Review", data=clip_rows([columns] + df.values.tolist())
+    )
+
+    # pyexcelerate columns and rows are 1-based. Every Review value is text.
+    for col_index, column_name in enumerate(columns, start=1):
+        alignment = nowrap_alignment if column_name == "copy_paste" else wrap_alignment
+        worksheet.set_col_style(
+            col_index,
+            Style(
+                size=REVIEW_COLUMN_WIDTHS.get(column_name),
+                alignment=alignment,
+                data_type=as_text,
+            ),
+        )
+
+    # Freeze header row and the first two columns (category, title)
+    worksheet.panes = Panes(2, 1)
+
+    # Bold, bordered header to match the xlsxwriter writer
+    header_style = Style(
+        font=Font(bold=True),
+        borders=Borders(left=Border(), right=Border(), top=Border(), bottom=Border()),
+        alignment=Alignment(horizontal="center", vertical="top"),
+        data_type=as_text,
+    )
+    for col_index in range(1, len(columns) + 1):
+        worksheet.set_cell_style(1, col_index, header_style)
+
+    # A cell style replaces the column style, so fills carry the alignment too
+    fill_styles = {
+        value: Style(
+            fill=Fill(background=Color(*bytes.fromhex(color.lstrip("#")))),
+            alignment=wrap_alignment,
+            data_type=as_text,
+        )
+        for value, color in FILL_COLORS.items()
+    }
+    for column_name in FILLED_COLUMNS:
+        col_index = columns.index(column_name) + 1
+        for row_idx, value in enumerate(df[column_name].tolist(), start=2):
+            style = fill_styles.get(value)
+            if style is not None:
+                worksheet.set_cell_style(row_idx, col_index, style)
+
+    about_data = clip_rows([list(ABOUT_COLUMNS)] + [list(row) for row in about_rows])
+    about_ws = workbook.new_sheet("ABOUT", data=about_data)
+    about_ws.set_col_style(1, Style(size=24, alignment=wrap_alignment, data_type=as_text))
+    about_ws.set_col_style(2, Style(size=90, alignment=wrap_alignment))
+    # The value column mixes numbers and text, so only pin formula-looking text
+    about_ws.set_cell_style(1, 1, header_style)
+    about_ws.set_cell_style(1, 2, header_style)
+    about_text_style = Style(alignment=wrap_alignment, data_type=as_text)
+    for row_idx, row in enumerate(about_data, start=1):
+        if isinstance(row[1], str) and row[1].startswith("="):
+            about_ws.set_cell_style(row_idx, 2, about_text_style)
+
+    workbook.save(str(out_path))
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -112,6 +557,31 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Don't prompt; rely solely on flags (useful for scripts)",
     )
+    parser.add_argument(
+        "--dump-backend",
+        dest="dump_backend",
+        choices=DUMP_BACKENDS,
+        default="auto",
+        help="How to dump the repo to XML: in-process walker, repomix, or auto (repomix if on PATH, else the walker when pathspec is installed)",
+    )
+    parser.add_argument(
+        "--no-token-count",
+        dest="token_count",
+        action="store_false",
+        help="Skip tiktoken and report the approximate (chars / 4) token count",
+    )
+    parser.add_argument(
+        "--no-json",
+        dest="print_json",
+        action="store_false",
+        help="Don't print the JSON response to stdout",
+    )
+    parser.add_argument(
+        "--fast-excel",
+        dest="fast_excel",
+        action="store_true",
+        help="Write the Excel report with pyexcelerate (falls back to xlsxwriter if not installed)",
+    )
     return parser.parse_args(argv)
 
 
@@ -144,13 +614,22 @@ def main(argv: list[str] | None = None) -> int:
     ns = parse_args(argv or sys.argv[1:])
     repo_path = Path(ns.path).resolve()
 
-    if not ensure_repomix_available():
+    dump_backend = resolve_dump_backend(ns.dump_backend)
+    if dump_backend == "repomix" and not ensure_repomix_available():
         print(
             "ERROR: repomix is not installed or not found in PATH. Please install repomix and try again.",
             file=sys.stderr,
         )
         return 2
 
+    # Load the tokenizer and build the agent in the background: both are
+    # independent of the prompts and the repo dump, so the BPE load and the
+    # pydantic-ai import overlap with them
+    agent_future = _build_agent_in_background()
+    encoder_future = None
+    if ns.token_count:
+        encoder_future = _load_encoder_in_background()
+
     issues = ns.issues if ns.issues is not None else 10
     instructions = ns.instructions
 
@@ -161,33 +640,34 @@ def main(argv: list[str] | None = None) -> int:
             instructions = prompt_for_optional_text("Any additional user instructions?")
 
     try:
-        xml = dump_repo_to_xml(repo_path, keep=ns.keep)
+        xml = dump_repo_to_xml(repo_path, keep=ns.keep, backend=dump_backend)
     except Exception as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 1
 
-    if run_code_review is None:
+    # Collect the agent started in the background (not imported at module
+    # level, so `--help` and early error paths don't pay for pydantic-ai);
+    # this surfaces a missing GOOGLE_API_KEY before the model call
+    try:
+        agent_future.result()
+        from .prompting import run_code_review
+    except Exception:
         print(
             "ERROR: prompting module not available (check GOOGLE_API_KEY or dependencies).",
             file=sys.stderr,
         )
         return 3
 
-    # Token count using tiktoken if available; fallback to simple heuristic
+    # Token count using tiktoken if available (and not disabled); fallback to
+    # simple heuristic
     token_count_method = "approx-heuristic"
     token_count = max(1, (len(xml) + 3) // 4)
-    try:
-        import tiktoken  # type: ignore
-
+    if encoder_future is not None:
         try:
-            enc = tiktoken.get_encoding("o200k_base")
+            token_count = count_tokens(encoder_future.result(), xml)
+            token_count_method = "tiktoken"
         except Exception:
-            # Fallback to a widely available base if o200k_base is not present
-            enc = tiktoken.get_encoding("cl100k_base")
-        token_count = len(enc.encode(xml))
-        token_count_method = "tiktoken"
-    except Exception:
-        pass
+            pass
 
     print(
         f"[info] Repository token count ({token_count_method}): {token_count:,}",
@@ -209,32 +689,6 @@ def main(argv: list[str] | None = None) -> int:
     try:
         import pandas as pd
 
-        rows = []
-        for issue in review_response.issues:
-            # Programmatically generated Markdown summary for easy copy/paste
-            copy_paste_md = (
-                f"### [{issue.category}] {issue.title}\n"
-                f"- Severity: {issue.severity}\n"
-                f"- Location: {issue.location}\n"
-                f"- Effort: {issue.estimated_effort}\n"
-                f"- Rationale: {issue.rationale}\n"
-                f"- Implementation plan: {issue.implementation_plan}\n\n"
-                f"{issue.detailed_description}"
-            )
-
-            rows.append(
-                {
-                    "category": issue.category,
-                    "title": issue.title,
-                    "severity": issue.severity,
-                    "location": issue.location,
-                    "estimated_effort": issue.estimated_effort,
-                    "rationale": issue.rationale,
-                    "implementation_plan": issue.implementation_plan,
-                    "detailed_description": issue.detailed_description,
-                    "copy_paste": copy_paste_md,
-                }
-            )
         desired_columns = [
             "category",
             "title",
@@ -246,8 +700,35 @@ def main(argv: list[str] | None = None) -> int:
             "implementation_plan",
             "copy_paste",
         ]
-        df = pd.DataFrame(rows)
-        df = df.reindex(columns=desired_columns)
+        df = pd.DataFrame(
+            [issue.model_dump() for issue in review_response.issues],
+            columns=desired_columns[:-1],
+        )
+        # Both Excel writers colour these columns by exact value, so normalise
+        # stray whitespace from the model ("Low ") once, up front
+        for column_name in FILLED_COLUMNS:
+            df[column_name] = df[column_name].str.strip()
+
+        # Programmatically generated Markdown summary for easy copy/paste, built
+        # column-wise rather than formatting one issue at a time
+        df["copy_paste"] = (
+            "### ["
+            + df["category"]
+            + "] "
+            + df["title"]
+            + "\n- Severity: "
+            + df["severity"]
+            + "\n- Location: "
+            + df["location"]
+            + "\n- Effort: "
+            + df["estimated_effort"]
+            + "\n- Rationale: "
+            + df["rationale"]
+            + "\n- Implementation plan: "
+            + df["implementation_plan"]
+            + "\n\n"
+            + df["detailed_description"]
+        )
 
         # Timestamped output filename as requested: gemini_code_review_[mm]-[dd]-[yyyy]_[hh]-[mm].xlsx
         now = datetime.now()
@@ -255,132 +736,54 @@ def main(argv: list[str] | None = None) -> int:
         out_filename = f"gemini_code_review_{timestamp}.xlsx"
         out_path = Path.cwd() / out_filename
 
-        from openpyxl.styles import Alignment, PatternFill
-        from openpyxl.utils import get_column_letter
-
-        with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
-            sheet_name = "Review"
-            df.to_excel(writer, index=False, sheet_name=sheet_name)
-
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
-
-            column_widths = {
-                "category": 15,
-                "title": 40,
-                "severity": 10,
-                "location": 25,
-                "estimated_effort": 15,
-                "rationale": 40,
-                "implementation_plan": 60,
-                "detailed_description": 60,
-                "copy_paste": 20,
-            }
-            for col_index, column_name in enumerate(desired_columns, start=1):
-                letter = get_column_letter(col_index)
-                width = column_widths.get(column_name)
-                if width is not None:
-                    worksheet.column_dimensions[letter].width = width
-
-            # Freeze header row and the first two columns (category, title)
-            worksheet.freeze_panes = "C2"
-
-            wrap_alignment = Alignment(wrap_text=True, vertical="top")
-            for row in worksheet.iter_rows(
-                min_row=1,
-                max_row=worksheet.max_row,
-                min_col=1,
-                max_col=worksheet.max_column,
-            ):
-                for cell in row:
-                    cell.alignment = wrap_alignment
-
-            # Ensure the copy_paste column does not wrap
-            try:
-                copy_col_index = desired_columns.index("copy_paste") + 1
-                for row_idx in range(1, worksheet.max_row + 1):
-                    cell = worksheet.cell(row=row_idx, column=copy_col_index)
-                    cell.alignment = Alignment(wrap_text=False, vertical="top")
-            except ValueError:
-                pass
-
-            fill_for_value = {
-                "Low": PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid"),
-                "Medium": PatternFill(start_color="FFFFEB9C", end_color="FFFFEB9C", fill_type="solid"),
-                "High": PatternFill(start_color="FFF8CBAD", end_color="FFF8CBAD", fill_type="solid"),
-                "Critical": PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid"),
-                "Very High": PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid"),
-            }
-
-            severity_col_index = desired_columns.index("severity") + 1
-            effort_col_index = desired_columns.index("estimated_effort") + 1
-
-            for row_idx in range(2, worksheet.max_row + 1):
-                sev_cell = worksheet.cell(row=row_idx, column=severity_col_index)
-                sev_value = str(sev_cell.value).strip() if sev_cell.value is not None else ""
-                if sev_value in fill_for_value:
-                    sev_cell.fill = fill_for_value[sev_value]
-
-                eff_cell = worksheet.cell(row=row_idx, column=effort_col_index)
-                eff_value = str(eff_cell.value).strip() if eff_cell.value is not None else ""
-                if eff_value in fill_for_value:
-                    eff_cell.fill = fill_for_value[eff_value]
-
-            # ABOUT sheet with run metadata
-            about_sheet_name = "ABOUT"
-            about_rows = [
-                {"Field": "Generated At", "Value": now.strftime("%Y-%m-%d %H:%M")},
-                {"Field": "Repository Path", "Value": str(repo_path)},
-                {"Field": "Output File", "Value": out_filename},
-                {"Field": "Token Count", "Value": token_count},
-                {"Field": "Token Count Method", "Value": token_count_method},
-                {"Field": "Issues Requested", "Value": issues},
-                {"Field": "Issues Returned", "Value": len(review_response.issues)},
-                {"Field": "User Instructions", "Value": instructions or ""},
-                {"Field": "Model", "Value": "gemini-2.5-pro"},
-                {
-                    "Field": "Notes",
-                    "Value": (
-                        "Token count is an approximation based on XML size (\u2248 1 token per 4 chars)."
-                    ),
-                },
-            ]
-            df_about = pd.DataFrame(about_rows, columns=["Field", "Value"])
-            df_about.to_excel(writer, index=False, sheet_name=about_sheet_name)
-
-            about_ws = writer.sheets[about_sheet_name]
-            # Set reasonable column widths
-            about_ws.column_dimensions[get_column_letter(1)].width = 24
-            about_ws.column_dimensions[get_column_letter(2)].width = 90
-            # Wrap text and top-align
-            for row in about_ws.iter_rows(
-                min_row=1,
-                max_row=about_ws.max_row,
-                min_col=1,
-                max_col=about_ws.max_column,
-            ):
-                for cell in row:
-                    cell.alignment = wrap_alignment
+        # ABOUT sheet with run metadata
+        about_rows = [
+            ("Generated At", now.strftime("%Y-%m-%d %H:%M")),
+            ("Repository Path", str(repo_path)),
+            ("Output File", out_filename),
+            ("Token Count", token_count),
+            ("Token Count Method", token_count_method),
+            ("Issues Requested", issues),
+            ("Issues Returned", len(review_response.issues)),
+            ("User Instructions", instructions or ""),
+            ("Model", "gemini-2.5-pro"),
+            (
+                "Notes",
+                "Token count is an approximation based on XML size (\u2248 1 token per 4 chars).",
+            ),
+        ]
+
+        use_fast_excel = ns.fast_excel and pyexcelerate_available()
+        if ns.fast_excel and not use_fast_excel:
+            print(
+                "[warn] --fast-excel requested but pyexcelerate is not installed; using xlsxwriter.",
+                file=sys.stderr,
+            )
+        if use_fast_excel:
+            write_excel_pyexcelerate(out_path, df, about_rows)
+        else:
+            write_excel_xlsxwriter(out_path, df, about_rows)
 
         print(f"[info] Wrote Excel report to {out_path}", file=sys.stderr)
     except Exception as exc:
         print(f"ERROR: failed to write Excel file: {exc}", file=sys.stderr)
         return 5
 
-    try:
-        import json
-        from pydantic import BaseModel
-
-        def model_to_dict(obj):
-            if isinstance(obj, BaseModel):
-                return obj.model_dump()
-            if isinstance(obj, list):
-                return [model_to_dict(o) for o in obj]
-            return obj
-
-        print(json.dumps(model_to_dict(review_response), indent=2))
-    except Exception:
-        pass
+    if ns.print_json:
+        try:
+            # pydantic's native serializer; avoids a Python-level dict round trip.
+            # It emits raw UTF-8 (json.dumps used to escape non-ASCII), so write
+            # bytes where possible rather than trusting stdout's encoding.
+            payload = review_response.model_dump_json(indent=2) + "\n"
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is not None:
+                sys.stdout.flush()
+                buffer.write(payload.encode("utf-8"))
+                buffer.flush()
+            else:
+                sys.stdout.write(payload)
+        except Exception as exc:
+            print(f"[warn] Failed to print JSON to stdout: {exc}", file=sys.stderr)
 
     return 0
 
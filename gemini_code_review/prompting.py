@@ -6,10 +6,12 @@ Module that handles prompting the Gemini API.
 # SETUP
 # =====
 
+import functools
 import os
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic_ai import Agent
+from pydantic_ai import Agent, RunContext
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
 from pydantic import BaseModel, Field
@@ -19,26 +21,25 @@ from dotenv import load_dotenv
 load_dotenv(override=True)
 
 
-# Configure model provider
-google_api_key = os.getenv("GOOGLE_API_KEY")
-if not google_api_key:
-    raise ValueError("GOOGLE_API_KEY environment variable is not set.")
-provider = GoogleProvider(api_key=google_api_key)
-model = GoogleModel(model_name="gemini-3-pro-preview", provider=provider)
+@functools.lru_cache(maxsize=1)
+def get_model() -> GoogleModel:
+    """Configure the model provider on first use and return the Gemini model."""
+    google_api_key = os.getenv("GOOGLE_API_KEY")
+    if not google_api_key:
+        raise ValueError("GOOGLE_API_KEY environment variable is not set.")
+    provider = GoogleProvider(api_key=google_api_key)
+    return GoogleModel(model_name="gemini-3-pro-preview", provider=provider)
 
 
-def generate_system_prompt(
-    n_issues_to_surface: int = 10, user_instructions: Optional[str] = None
-) -> str:
-    """Generate the system prompt for the code review agent."""
-
-    prompt_template = f"""# Role
+# Prompt skeleton, filled via str.format_map. `{user_block}` is substituted at
+# import time below, so each call only has to format in the per-run values.
+_PROMPT_TMPL = """# Role
 You are a code review assistant, tasked with analyzing an entire codebase and providing detailed feedback on potential issues, improvements, and best practices.
 
 # Task
 The user will provide you with an XML representation of their codebase.
 
-You'll identify {n_issues_to_surface} of the most impactful, actionable issues that could be addressed to help improve the codebase.
+You'll identify {n_issues} of the most impactful, actionable issues that could be addressed to help improve the codebase.
 
 # Issue Types
 These issues could include, but are not limited to:
@@ -51,14 +52,13 @@ These issues could include, but are not limited to:
 - **Testing**: Gaps in automated test coverage, flaky tests, or missing integration/CI checks that weaken confidence in changes.
 - **Developer experience (devx)**: Build process, environment setup, or tooling issues (e.g. missing linters, unclear contribution guidelines) that slow down development.
 
-[USER_INSTRUCTIONS]
+{user_block}
 
 # Output Format
 You'll respond with a well-structured JSON object matching the provided schema. For each issue, also include an `implementation_plan` of 1-3 sentences describing concrete next steps to address the issue.
 """
 
-    if user_instructions:
-        user_instructions_clause = f"""# User Instructions
+_USER_INSTRUCTIONS_BLOCK = """# User Instructions
 The user provided some additional instructions to consider while performing the code review:
 
 ---
@@ -67,13 +67,23 @@ The user provided some additional instructions to consider while performing the
 
 ---
 """
-        prompt_template = prompt_template.replace(
-            "[USER_INSTRUCTIONS]", user_instructions_clause
-        )
-    else:
-        prompt_template = prompt_template.replace("[USER_INSTRUCTIONS]", "")
 
-    return prompt_template
+_PROMPT_WITHOUT_INSTRUCTIONS = _PROMPT_TMPL.replace("{user_block}", "")
+_PROMPT_WITH_INSTRUCTIONS = _PROMPT_TMPL.replace(
+    "{user_block}", _USER_INSTRUCTIONS_BLOCK
+)
+
+
+def generate_system_prompt(
+    n_issues_to_surface: int = 10, user_instructions: Optional[str] = None
+) -> str:
+    """Generate the system prompt for the code review agent."""
+
+    if user_instructions:
+        return _PROMPT_WITH_INSTRUCTIONS.format_map(
+            {"n_issues": n_issues_to_surface, "user_instructions": user_instructions}
+        )
+    return _PROMPT_WITHOUT_INSTRUCTIONS.format_map({"n_issues": n_issues_to_surface})
 
 
 class CodebaseIssue(BaseModel):
@@ -115,6 +125,34 @@ class CodeReviewResponse(BaseModel):
     issues: list[CodebaseIssue] = Field(..., description="List of identified issues.")
 
 
+@dataclass
+class ReviewSettings:
+    """Per-run settings used to render the agent's system prompt."""
+
+    n_issues_to_surface: int = 10
+    user_instructions: Optional[str] = None
+
+
+def _system_prompt(ctx: RunContext[ReviewSettings]) -> str:
+    return generate_system_prompt(
+        n_issues_to_surface=ctx.deps.n_issues_to_surface,
+        user_instructions=ctx.deps.user_instructions,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_code_review_agent() -> Agent[ReviewSettings, CodeReviewResponse]:
+    """Build the code review agent once and reuse it across runs.
+
+    The system prompt is rendered per run from the ReviewSettings passed as deps.
+    """
+    agent = Agent(
+        model=get_model(), deps_type=ReviewSettings, output_type=CodeReviewResponse
+    )
+    agent.system_prompt(_system_prompt)
+    return agent
+
+
 def run_code_review(
     codebase_xml: str,
     n_issues_to_surface: int = 10,
@@ -122,12 +160,8 @@ def run_code_review(
 ) -> CodeReviewResponse:
     """Run the Gemini Code Review agent on the provided codebase XML."""
 
-    system_prompt = generate_system_prompt(
+    settings = ReviewSettings(
         n_issues_to_surface=n_issues_to_surface, user_instructions=user_instructions
     )
-
-    agent = Agent(
-        model=model, system_prompt=system_prompt, output_type=CodeReviewResponse
-    )
-    result = agent.run_sync(codebase_xml)
+    result = get_code_review_agent().run_sync(codebase_xml, deps=settings)
     return result.output